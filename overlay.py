@@ -160,6 +160,25 @@ class SettingsWindow(QtWidgets.QWidget):
             layout.addWidget(QtWidgets.QLabel("Count:"), 4, 0)
             layout.addWidget(count_spin, 4, 1)
 
+        if group_key == 'bounce_lines':
+            extend_check = QtWidgets.QCheckBox("Always Extend")
+            extend_check.setChecked(self.overlay.settings.get('always_extend_aim_line', False))
+            extend_check.stateChanged.connect(self.change_always_extend_aim_line)
+            layout.addWidget(extend_check, 4, 0)
+
+        if group_key == 'cue_ball_path':
+            rail_spin = QtWidgets.QSpinBox()
+            rail_spin.setRange(1, 5)
+            rail_spin.setValue(self.overlay.settings.get('cue_path_rail_count', 2))
+            rail_spin.valueChanged.connect(self.change_cue_path_rail_count)
+            layout.addWidget(QtWidgets.QLabel("Rails:"), 4, 0)
+            layout.addWidget(rail_spin, 4, 1)
+
+            flip_check = QtWidgets.QCheckBox("Flip Side")
+            flip_check.setChecked(self.overlay.settings.get('cue_path_side', 1) < 0)
+            flip_check.stateChanged.connect(self.change_cue_path_side)
+            layout.addWidget(flip_check, 5, 0)
+
         box.setContentLayout(layout)
         self.boxes.append(box)
         return box
@@ -188,6 +207,21 @@ class SettingsWindow(QtWidgets.QWidget):
         self.overlay.save_settings()
         self.overlay.update()
 
+    def change_always_extend_aim_line(self, state):
+        self.overlay.settings['always_extend_aim_line'] = (state == Qt.Checked)
+        self.overlay.save_settings()
+        self.overlay.update()
+
+    def change_cue_path_rail_count(self, value):
+        self.overlay.settings['cue_path_rail_count'] = value
+        self.overlay.save_settings()
+        self.overlay.update()
+
+    def change_cue_path_side(self, state):
+        self.overlay.settings['cue_path_side'] = -1 if state == Qt.Checked else 1
+        self.overlay.save_settings()
+        self.overlay.update()
+
     def update_info_panel(self):
         for spin in [self.rect_x_spin, self.rect_y_spin, self.rect_w_spin, self.rect_h_spin]:
             spin.blockSignals(True)
@@ -241,7 +275,8 @@ class SettingsWindow(QtWidgets.QWidget):
             'pocket_line_shadow': "Pocket Line Shadow", # <-- NEW GROUP
             'center_ghost': "Object Ball",
             'connecting_line': "Connecting Line", 'bounce_ghost': "Movable Ghost Ball", 
-            'bounce_visuals': "Bounce Ghost Balls", 'bounce_lines': "Bounce Lines"
+            'bounce_visuals': "Bounce Ghost Balls", 'bounce_lines': "Bounce Lines",
+            'cue_ball_path': "Cue Ball Path"
         }
         for key, title in groups.items():
             content_layout.addWidget(self.create_setting_group(key, title))
@@ -371,9 +406,13 @@ class OverlayWindow(QtWidgets.QWidget):
             'bounce_ghost': {'visible': True, 'size': 17, 'color': [0, 255, 0, 100]},
             'bounce_visuals': {'visible': True, 'size': 17, 'color': [255, 255, 255, 60]},
             'bounce_lines': {'visible': True, 'size': 2, 'color': [255, 255, 0, 255]},
+            'cue_ball_path': {'visible': False, 'size': 2, 'color': [255, 255, 255, 200]},
             'gui_theme': {'visible': True, 'size': 1, 'color': [26, 113, 207, 230]},
             'font_color': {'visible': True, 'size': 1, 'color': [0, 0, 42, 255]},
             'bounce_count': 2,
+            'always_extend_aim_line': False,
+            'cue_path_rail_count': 2,
+            'cue_path_side': 1,
         }
 
     def load_settings(self):
@@ -566,21 +605,19 @@ class OverlayWindow(QtWidgets.QWidget):
 
         object_ball, ghost_ball = self.control_points
         
-        # --- NEW: Draw shadows first, underneath the main lines ---
+        # --- Draw shadows first, underneath the main lines ---
         if s['pocket_line_shadow']['visible']:
             shadow_pen = QtGui.QPen(QtGui.QColor(*s['pocket_line_shadow']['color']), s['pocket_line_shadow']['size'])
             painter.setPen(shadow_pen)
-            for pocket in self.pockets:
-                painter.drawLine(int(object_ball[0]) + 1, int(object_ball[1]) + 1, int(pocket.x()) + 1, int(pocket.y()) + 1)
+            painter.drawLines(self.build_pocket_lines(object_ball, offset=1))
 
         if s['pocket_lines']['visible']:
             painter.setPen(QtGui.QPen(QtGui.QColor(*s['pocket_lines']['color']), s['pocket_lines']['size']))
-            for pocket in self.pockets:
-                painter.drawLine(int(object_ball[0]), int(object_ball[1]), int(pocket.x()), int(pocket.y()))
+            painter.drawLines(self.build_pocket_lines(object_ball))
         
         if s['connecting_line']['visible']:
             painter.setPen(QtGui.QPen(QtGui.QColor(*s['connecting_line']['color']), s['connecting_line']['size']))
-            painter.drawLine(int(object_ball[0]), int(object_ball[1]), int(ghost_ball[0]), int(ghost_ball[1]))
+            painter.drawLine(QtCore.QLineF(QtCore.QPointF(*object_ball), QtCore.QPointF(*ghost_ball)))
 
         if s['center_ghost']['visible']:
             painter.setBrush(QtGui.QBrush(QtGui.QColor(*s['center_ghost']['color'])))
@@ -602,53 +639,98 @@ class OverlayWindow(QtWidgets.QWidget):
             corner_pos = self.table_border.topLeft() if self.keyboard_resize_corner == 'top_left' else self.table_border.bottomRight()
             painter.drawRect(QtCore.QRect(corner_pos.x() - handle_size, corner_pos.y() - handle_size, handle_size * 2, handle_size * 2))
 
-        self.draw_bounce_prediction(painter, ghost_ball)
+        self.draw_contact_prediction(painter, object_ball, ghost_ball)
         painter.end()
 
-    def draw_bounce_prediction(self, painter, ghost_ball):
-        radius = self.settings['center_ghost']['size']
-        physics_border = self.table_border.adjusted(radius, radius, -radius, -radius)
-        tolerance = 1.0
-        is_on_physics_border = (abs(ghost_ball[0] - physics_border.left()) <= tolerance or
-                                abs(ghost_ball[0] - physics_border.right()) <= tolerance or
-                                abs(ghost_ball[1] - physics_border.top()) <= tolerance or
-                                abs(ghost_ball[1] - physics_border.bottom()) <= tolerance)
-        if not is_on_physics_border: return
-        object_ball = self.control_points[0]
+    def turn_away_from_border(self, pos, dx, dy, physics_border, tolerance=1.0):
+        if abs(pos[0] - physics_border.left()) <= tolerance and dx < 0: dx = -dx
+        if abs(pos[0] - physics_border.right()) <= tolerance and dx > 0: dx = -dx
+        if abs(pos[1] - physics_border.top()) <= tolerance and dy < 0: dy = -dy
+        if abs(pos[1] - physics_border.bottom()) <= tolerance and dy > 0: dy = -dy
+        return dx, dy
+
+    def is_on_physics_border(self, pos, physics_border, tolerance=1.0):
+        return (abs(pos[0] - physics_border.left()) <= tolerance or
+                abs(pos[0] - physics_border.right()) <= tolerance or
+                abs(pos[1] - physics_border.top()) <= tolerance or
+                abs(pos[1] - physics_border.bottom()) <= tolerance)
+
+    def draw_contact_prediction(self, painter, object_ball, ghost_ball):
+        s = self.settings
+        show_object_path = s['bounce_visuals']['visible'] or s['bounce_lines']['visible']
+        show_cue_path = s['cue_ball_path']['visible']
+        if not show_object_path and not show_cue_path: return
         dx = ghost_ball[0] - object_ball[0]
         dy = ghost_ball[1] - object_ball[1]
         if dx == 0 and dy == 0: return
         length = math.hypot(dx, dy)
         dx /= length; dy /= length
-        if abs(ghost_ball[0] - physics_border.left()) <= tolerance and dx < 0: dx = -dx
-        if abs(ghost_ball[0] - physics_border.right()) <= tolerance and dx > 0: dx = -dx
-        if abs(ghost_ball[1] - physics_border.top()) <= tolerance and dy < 0: dy = -dy
-        if abs(ghost_ball[1] - physics_border.bottom()) <= tolerance and dy > 0: dy = -dy
-        self.draw_physics_bounces(painter, ghost_ball, dx, dy)
-
-    def draw_physics_bounces(self, painter, start_pos, dx, dy):
+        radius = s['center_ghost']['size']
+        physics_border = self.table_border.adjusted(radius, radius, -radius, -radius)
+        # The object ball follows the aim line on through the ghost ball. By default it is only
+        # extended when the ghost sits on the rail; 'always_extend_aim_line' extends it from anywhere.
+        if show_object_path and (s.get('always_extend_aim_line', False) or self.is_on_physics_border(ghost_ball, physics_border)):
+            object_dx, object_dy = self.turn_away_from_border(ghost_ball, dx, dy, physics_border)
+            points = self.trace_physics_path(ghost_ball, object_dx, object_dy, s.get('bounce_count', 5), physics_border)
+            self.draw_physics_bounces(painter, points)
+        if show_cue_path:
+            cue_ray = self.calculate_cue_ray(object_ball, dx, dy, physics_border)
+            if not cue_ray: return
+            contact, tangent_dx, tangent_dy = cue_ray
+            points = self.trace_physics_path(contact, tangent_dx, tangent_dy, s.get('cue_path_rail_count', 2), physics_border)
+            if len(points) < 2: return
+            painter.setPen(QtGui.QPen(QtGui.QColor(*s['cue_ball_path']['color']), s['cue_ball_path']['size'], Qt.DashDotLine))
+            painter.setBrush(Qt.NoBrush)
+            painter.drawPolyline(QtGui.QPolygonF([QtCore.QPointF(*point) for point in points]))
+
+    def calculate_cue_ray(self, object_ball, dx, dy, physics_border):
+        # The cue ball touches the object ball one ball diameter behind it and leaves along the
+        # tangent line (90 degree rule). If that point is off the table the shot is impossible.
+        radius = self.settings['center_ghost']['size']
+        contact = (object_ball[0] - 2 * radius * dx, object_ball[1] - 2 * radius * dy)
+        if not (physics_border.left() <= contact[0] <= physics_border.right() and
+                physics_border.top() <= contact[1] <= physics_border.bottom()):
+            return None
+        side = self.settings.get('cue_path_side', 1)
+        tangent_dx, tangent_dy = self.turn_away_from_border(contact, -dy * side, dx * side, physics_border)
+        return contact, tangent_dx, tangent_dy
+
+    def build_pocket_lines(self, object_ball, offset=0):
+        x, y = object_ball[0] + offset, object_ball[1] + offset
+        return [QtCore.QLineF(x, y, pocket.x() + offset, pocket.y() + offset) for pocket in self.pockets]
+
+    def draw_physics_bounces(self, painter, points):
         s = self.settings
-        max_bounces = s.get('bounce_count', 5)
+        if len(points) < 2: return
+        # Ghosts are filled as one path, so overlapping translucent ghosts no longer darken where they overlap.
+        if s['bounce_visuals']['visible']:
+            size = s['bounce_visuals']['size']
+            ghost_path = QtGui.QPainterPath()
+            ghost_path.setFillRule(Qt.WindingFill)
+            for point in points[1:]:
+                ghost_path.addEllipse(QtCore.QPointF(*point), size, size)
+            painter.setBrush(QtGui.QBrush(QtGui.QColor(*s['bounce_visuals']['color'])))
+            painter.setPen(QtCore.Qt.NoPen)
+            painter.drawPath(ghost_path)
+        if s['bounce_lines']['visible']:
+            color = s['bounce_lines']['color']
+            painter.setPen(QtGui.QPen(QtGui.QColor(*color), s['bounce_lines']['size'], Qt.DashLine))
+            painter.setBrush(Qt.NoBrush)
+            painter.drawPolyline(QtGui.QPolygonF([QtCore.QPointF(*point) for point in points]))
+
+    def trace_physics_path(self, start_pos, dx, dy, max_bounces, physics_border):
+        points = [start_pos]
         current_pos = start_pos
         current_dx, current_dy = dx, dy
-        for bounce_num in range(max_bounces):
-            intersection = self.find_table_intersection(current_pos[0], current_pos[1], current_dx, current_dy)
+        for _ in range(max_bounces):
+            intersection = self.find_table_intersection(current_pos[0], current_pos[1], current_dx, current_dy, physics_border)
             if not intersection: break
-            if s['bounce_visuals']['visible']:
-                painter.setBrush(QtGui.QBrush(QtGui.QColor(*s['bounce_visuals']['color'])))
-                painter.setPen(QtCore.Qt.NoPen)
-                painter.drawEllipse(QtCore.QPointF(*intersection), s['bounce_visuals']['size'], s['bounce_visuals']['size'])
-            if s['bounce_lines']['visible']:
-                color = s['bounce_lines']['color']
-                painter.setPen(QtGui.QPen(QtGui.QColor(*color), s['bounce_lines']['size'], Qt.DashLine))
-                painter.drawLine(int(current_pos[0]), int(current_pos[1]), int(intersection[0]), int(intersection[1]))
-            bounce_dx, bounce_dy = self.calculate_physics_reflection(current_dx, current_dy, intersection)
+            points.append(intersection)
+            current_dx, current_dy = self.calculate_physics_reflection(current_dx, current_dy, intersection, physics_border)
             current_pos = intersection
-            current_dx, current_dy = bounce_dx, bounce_dy
+        return points
 
-    def calculate_physics_reflection(self, dx, dy, intersection):
-        radius = self.settings['center_ghost']['size']
-        physics_border = self.table_border.adjusted(radius, radius, -radius, -radius)
+    def calculate_physics_reflection(self, dx, dy, intersection, physics_border):
         tolerance = 1e-6
         if abs(intersection[0] - physics_border.left()) < tolerance or abs(intersection[0] - physics_border.right()) < tolerance:
             return -dx, dy
@@ -656,9 +738,7 @@ class OverlayWindow(QtWidgets.QWidget):
             return dx, -dy
         return dx, dy
 
-    def find_table_intersection(self, x, y, dx, dy):
-        radius = self.settings['center_ghost']['size']
-        physics_border = self.table_border.adjusted(radius, radius, -radius, -radius)
+    def find_table_intersection(self, x, y, dx, dy, physics_border):
         t_vals = []
         if dx != 0:
             t_vals.append((physics_border.left() - x) / dx)